@@ -1,10 +1,41 @@
 import argparse
 import os
+from typing import Any
+from typing import Optional
 
 from ...settings import default_settings
 from ...settings import get_settings
 
 
+class FastAppendAction(argparse.Action):
+    """
+    Drop-in replacement for `action='append'` that appends in-place.
+
+    The stock action copies the accumulated list on every call, to avoid mutating a
+    configured default list -- at the cost of O(N^2) parse time for N flags. Here, we
+    copy a configured default only once (on first append), and append in-place from
+    then on.
+    """
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: Optional[str] = None,
+    ) -> None:
+        items = getattr(namespace, self.dest, None)
+        if items is None:
+            items = []
+            setattr(namespace, self.dest, items)
+        elif items is self.default:
+            # Don't let appends leak into the default list across parses.
+            items = list(items)
+            setattr(namespace, self.dest, items)
+
+        items.append(values)
+
+
 def valid_path(path: str) -> str:
     if not os.path.isfile(path):
         raise argparse.ArgumentTypeError(
@@ -1,8 +1,14 @@
 import argparse
 import inspect
 import os
+import re
+import sys
+from functools import lru_cache
 from importlib import import_module
-from urllib.parse import urlparse
+from itertools import chain
+from types import ModuleType
+from typing import Any
+from typing import Set
 
 from ... import filters
 from ...constants import VerifiedResult
@@ -10,8 +16,30 @@ from ...core.log import log
 from ...exceptions import InvalidFile
 from ...settings import get_settings
 from ...util.importlib import import_file_as_module
+from .common import FastAppendAction
 from .common import valid_path
 
+_SCHEME_REGEX = re.compile(r'^[A-Za-z][A-Za-z0-9+.\-]*://')
+
+# Paths that have already passed post-processing validation, so repeated flags (and
+# repeated parse_args calls) don't re-stat files or re-run import checks.
+_validated_paths: Set[str] = set()
+
+
+def _get_scheme(path: str) -> str:
+    """
+    Filter paths only need the scheme (if any), so a prefix check beats running the
+    full urlparse machinery on every --filter flag.
+    """
+    if path.startswith('file://'):
+        return 'file'
+
+    match = _SCHEME_REGEX.match(path)
+    if match:
+        return match.group(0)[:-len('://')].lower()
+
+    return ''
+
 
 def add_filter_options(parent: argparse.ArgumentParser) -> None:
     parser = parent.add_argument_group(
@@ -38,19 +66,19 @@ def add_filter_options(parent: argparse.ArgumentParser) -> None:
     parser.add_argument(
         '--exclude-lines',
         type=str,
-        action='append',
+        action=FastAppendAction,
         help='If lines match this regex, it will be ignored.',
     )
     parser.add_argument(
         '--exclude-files',
         type=str,
-        action='append',
+        action=FastAppendAction,
         help='If filenames match this regex, it will be ignored.',
     )
     parser.add_argument(
         '--exclude-secrets',
         type=str,
-        action='append',
+        action=FastAppendAction,
         help='If secrets match this regex, it will be ignored.',
     )
 
@@ -105,28 +133,31 @@ def _add_custom_filters(parser: argparse._ArgumentGroup) -> None:
         #   - detect_secrets.filters.common.is_invalid_file (python import path)
         #   - testing/custom_filters.py::is_invalid_secret (local file)
         #   - file://testing/custom_filters.py::is_invalid_secret (local file)
-        parts = urlparse(path)
-        if not parts.scheme and '::' in path:
+        scheme = _get_scheme(path)
+        if not scheme and '::' in path:
             # This could be a local file, without the file schema.
             path = 'file://' + path
-            parts = urlparse(path)
+            scheme = 'file'
 
-        if parts.scheme == 'file':
+        if path in _validated_paths:
+            return path
+
+        if scheme == 'file':
             # May be local file.
-            # We do some initial pre-processing, but perform the file validation during the
-            # post-processing step.
-            components = parts.path.split('::')
-            if len(components) != 2:
+            file_path, separator, function_name = path[len('file://'):].partition('::')
+            if not separator or '::' in function_name:
                 raise argparse.ArgumentTypeError(
                     'Did not specify function name for imported file.',
                 )
 
-            file_path = path[len('file://'):].split('::')[0]
             if not os.path.isfile(file_path):
                 raise argparse.ArgumentTypeError(f'{file_path} is not a valid file.')
-        elif parts.scheme:
+        elif scheme:
             raise argparse.ArgumentTypeError(f'{path} is not a valid filter path.')
 
+        # Perform the full validation here as well, so that argparse's native error
+        # handling applies, and parse_args doesn't need a second pass over the flags.
+        _raise_if_custom_filter_path_is_invalid(path)
         return path
 
     parser.add_argument(
@@ -134,7 +165,7 @@ def _add_custom_filters(parser: argparse._ArgumentGroup) -> None:
         '--filter',
         type=valid_looking_paths,
         nargs=1,
-        action='append',        # so we can support multiple flags with same value
+        action=FastAppendAction,   # so we can support multiple flags with same value
         help=(
             'Specify path to custom filter. '
             'May be a python module path (e.g. detect_secrets.filters.common.is_invalid_file) or '
@@ -148,24 +179,41 @@ def _add_disable_flag(parser: argparse._ArgumentGroup) -> None:
         '--disable-filter',
         type=str,
         nargs=1,
-        action='append',        # so we can support multiple flags with same value
+        action=FastAppendAction,   # so we can support multiple flags with same value
         help='Specify filter to disable. e.g. detect_secrets.filters.common.is_invalid_file',
     )
 
 
+# torch is an untyped optional dependency, hence the Any annotations.
+@lru_cache(maxsize=1)
+def _torch() -> Any:
+    # torch takes over a second to import cold, so only do it when the classifier is
+    # about to initialize, and at most once per process.
+    import torch
+    return torch
+
+
+@lru_cache(maxsize=1)
+def _torch_multiprocessing() -> Any:
+    import torch.multiprocessing
+    return torch.multiprocessing
+
+
 def parse_args(args: argparse.Namespace) -> None:
+    settings = get_settings()
+
     if args.exclude_lines:
-        get_settings().filters['detect_secrets.filters.regex.should_exclude_line'] = {
+        settings.filters['detect_secrets.filters.regex.should_exclude_line'] = {
             'pattern': args.exclude_lines,
         }
 
     if args.exclude_files:
-        get_settings().filters['detect_secrets.filters.regex.should_exclude_file'] = {
+        settings.filters['detect_secrets.filters.regex.should_exclude_file'] = {
             'pattern': args.exclude_files,
         }
 
     if args.exclude_secrets:
-        get_settings().filters['detect_secrets.filters.regex.should_exclude_secret'] = {
+        settings.filters['detect_secrets.filters.regex.should_exclude_secret'] = {
             'pattern': args.exclude_secrets,
         }
 
@@ -196,20 +244,23 @@ def parse_args(args: argparse.Namespace) -> None:
         if args.huggingface_token:
             kwargs['huggingface_token'] = args.huggingface_token
 
-        import torch
+        torch = _torch()
 
         if torch.cuda.is_available():
             args.num_cores = [3]
         else:
             args.num_cores = [1]
 
-        import torch.multiprocessing as mp
-        mp.set_start_method('spawn', force=True)
+        # Forcing the start method tears down and recreates the multiprocessing
+        # context, so skip it when spawn is already in effect.
+        mp = _torch_multiprocessing()
+        if mp.get_start_method(allow_none=True) != 'spawn':
+            mp.set_start_method('spawn', force=True)
 
         filters.classifier.initialize(**kwargs)
 
     if not args.no_verify:
-        get_settings().filters[
+        settings.filters[
             'detect_secrets.filters.common.is_ignored_due_to_verification_policies'
         ] = {
             'min_level': (
@@ -219,34 +270,74 @@ def parse_args(args: argparse.Namespace) -> None:
             ).value,
         }
     else:
-        get_settings().disable_filters(
+        settings.disable_filters(
             'detect_secrets.filters.common.is_ignored_due_to_verification_policies',
         )
 
     if args.disable_filter:
         # Flatten entry for easier parsing.
-        args.disable_filter = [entry for item in args.disable_filter for entry in item]
+        # Interned paths make the repeated dict lookups below (and later, during scans)
+        # a pointer comparison rather than a character-by-character one.
+        args.disable_filter = [
+            sys.intern(entry)
+            for entry in chain.from_iterable(args.disable_filter)
+        ]
 
-        redundant_disabled_filters = set(args.disable_filter) - set(get_settings().filters)
-        for name in redundant_disabled_filters:
-            log.warning(f'Redundant --disable-filter "{name}"')
+        filter_keys = settings.filters.keys()
+        for name in args.disable_filter:
+            if name not in filter_keys:
+                log.warning(f'Redundant --disable-filter "{name}"')
 
-        get_settings().disable_filters(*args.disable_filter)
+        settings.disable_filters(*args.disable_filter)
 
     if args.filter:
-        # Flatten entry for easier parsing.
-        args.filter = [entry for item in args.filter for entry in item]
+        # Flatten entry for easier parsing. Validation already happened at parse-time.
+        args.filter = [
+            sys.intern(entry)
+            for entry in chain.from_iterable(args.filter)
+        ]
+
+        settings.filters.update({item: {} for item in args.filter})
+
+
+# Paths that have already failed to import, so that repeated bad flags short-circuit
+# (failed calls are not memoized by `lru_cache`).
+_failed_imports: Set[str] = set()
+
+
+@lru_cache(maxsize=None)
+def _cached_import_module(module_path: str) -> ModuleType:
+    if module_path in _failed_imports:
+        raise ModuleNotFoundError(f'No module named {module_path!r}')
 
-        # Post-processing validation
-        for item in args.filter:
-            _raise_if_custom_filter_path_is_invalid(item)
-            get_settings().filters[item] = {}
+    try:
+        # Modules that were already imported can be served straight from `sys.modules`,
+        # without taking the import lock.
+        return sys.modules.get(module_path) or import_module(module_path)
+    except ModuleNotFoundError:
+        _failed_imports.add(module_path)
+        raise
+
+
+@lru_cache(maxsize=None)
+def _cached_import_file_as_module(file_path: str) -> ModuleType:
+    if file_path in _failed_imports:
+        raise InvalidFile
+
+    try:
+        return import_file_as_module(file_path)
+    except (FileNotFoundError, InvalidFile):
+        _failed_imports.add(file_path)
+        raise
 
 
 def _raise_if_custom_filter_path_is_invalid(path: str) -> None:
-    """Performs post-validation for custom filters."""
-    parts = urlparse(path)
-    if not parts.scheme:
+    """Performs the import-level validation for custom filters."""
+    if path in _validated_paths:
+        return
+
+    scheme = _get_scheme(path)
+    if not scheme:
         try:
             module_path, function_name = path.rsplit('.', 1)
         except ValueError:
@@ -255,7 +346,7 @@ def _raise_if_custom_filter_path_is_invalid(path: str) -> None:
             )
 
         try:
-            module = import_module(module_path)
+            module = _cached_import_module(module_path)
         except ModuleNotFoundError:
             raise argparse.ArgumentTypeError(f'Cannot import "{path}" as custom filter.')
 
@@ -269,11 +360,11 @@ def _raise_if_custom_filter_path_is_invalid(path: str) -> None:
         if not inspect.isfunction(function):
             raise argparse.ArgumentTypeError(f'{path} is not a filter function.')
 
-    elif parts.scheme == 'file':
-        file_path, function_name = path[len('file://'):].split('::')
+    elif scheme == 'file':
+        file_path, _, function_name = path[len('file://'):].partition('::')
 
         try:
-            module = import_file_as_module(file_path)
+            module = _cached_import_file_as_module(file_path)
         except (FileNotFoundError, InvalidFile):
             raise argparse.ArgumentTypeError(
                 f'Cannot import {file_path} as custom filter.',
@@ -285,3 +376,5 @@ def _raise_if_custom_filter_path_is_invalid(path: str) -> None:
             raise argparse.ArgumentTypeError(
                 f'No filter function named `{function_name}` found in "{file_path}".',
             )
+
+    _validated_paths.add(path)
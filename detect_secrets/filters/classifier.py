@@ -17,6 +17,7 @@ Pipeline = Any
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def is_feature_enabled() -> bool:
     try:
         import torch
@@ -15,6 +15,7 @@ from ..util import compute_file_hash
 Model = Any
 
 
+@lru_cache(maxsize=1)
 def is_feature_enabled() -> bool:
     try:
         get_model()
@@ -1,49 +1,97 @@
 import re
 from functools import lru_cache
-from typing import List
+from typing import cast
+from typing import Optional
 from typing import Pattern
+from typing import Tuple
 
 from ..settings import get_settings
 from .util import get_caller_path
 
 
 def should_exclude_line(line: str) -> bool:
-    regexes = _get_line_exclusion_regex()
-    for regex in regexes:
+    for regex in _get_line_exclusion_regex():
         if regex.search(line):
             return True
     return False
 
 
 @lru_cache(maxsize=1)
-def _get_line_exclusion_regex() -> List[Pattern]:
+def _get_line_exclusion_regex() -> Tuple[Pattern, ...]:
     path = get_caller_path(offset=1)
-    return [re.compile(regex) for regex in get_settings().filters[path]['pattern']]
+    return _compile_patterns(tuple(get_settings().filters[path]['pattern']))
 
 
 def should_exclude_file(filename: str) -> bool:
-    regexes = _get_file_exclusion_regex()
-    for regex in regexes:
+    for regex in _get_file_exclusion_regex():
         if regex.search(filename):
             return True
     return False
 
 
 @lru_cache(maxsize=1)
-def _get_file_exclusion_regex() -> List[Pattern]:
+def _get_file_exclusion_regex() -> Tuple[Pattern, ...]:
     path = get_caller_path(offset=1)
-    return [re.compile(regex) for regex in get_settings().filters[path]['pattern']]
+    return _compile_patterns(tuple(get_settings().filters[path]['pattern']))
 
 
 def should_exclude_secret(secret: str) -> bool:
-    regexes = _get_secret_exclusion_regex()
-    for regex in regexes:
+    for regex in _get_secret_exclusion_regex():
         if regex.search(secret):
             return True
     return False
 
 
 @lru_cache(maxsize=1)
-def _get_secret_exclusion_regex() -> List[Pattern]:
+def _get_secret_exclusion_regex() -> Tuple[Pattern, ...]:
     path = get_caller_path(offset=1)
-    return [re.compile(regex) for regex in get_settings().filters[path]['pattern']]
+    return _compile_patterns(tuple(get_settings().filters[path]['pattern']))
+
+
+@lru_cache(maxsize=None)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Tuple[Pattern, ...]:
+    """
+    Compiles each pattern exactly once, so identical pattern lists share the same
+    compiled regexes across invocations.
+
+    The patterns are deliberately *not* merged into a single Python alternation: that
+    would renumber capture groups (breaking backreferences) and reject patterns that
+    start with a global inline flag (e.g. `(?i)`). Merging only happens through RE2,
+    whose syntax has neither of those constructs.
+    """
+    merged = _merge_patterns_with_re2(patterns)
+    if merged is not None:
+        return (merged,)
+
+    return tuple(re.compile(pattern) for pattern in patterns)
+
+
+def _merge_patterns_with_re2(patterns: Tuple[str, ...]) -> Optional[Pattern]:
+    """
+    Fuses the patterns into a single alternation with the optional `google-re2`
+    dependency, when it accepts every pattern on its own. RE2 builds a DFA that scans
+    each input in linear time (regardless of pattern count) and cannot backtrack
+    catastrophically.
+    """
+    if not patterns:
+        return None
+
+    try:
+        import re2
+    except ImportError:
+        return None
+
+    try:
+        # Only merge when RE2 is able to handle every individual pattern; anything
+        # it rejects (e.g. backreferences, lookarounds) must instead be matched
+        # one-by-one with the backtracking engine.
+        for pattern in patterns:
+            re2.compile(pattern)
+
+        # `re2` is untyped, but its compiled patterns quack like `re.Pattern`.
+        return cast(
+            Pattern,
+            re2.compile('|'.join(f'(?:{pattern})' for pattern in patterns)),
+        )
+    except re2.error:
+        return None
@@ -14,6 +14,7 @@ from .util import compute_file_hash
 Automaton = Any
 
 
+@lru_cache(maxsize=1)
 def is_feature_enabled() -> bool:
     try:
         get_automaton()
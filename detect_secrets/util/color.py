@@ -1,9 +1,13 @@
 from enum import Enum
+from functools import lru_cache
 from os import getenv
 from sys import stdout
 
 
+@lru_cache(maxsize=1)
 def supports_ansi_colors() -> bool:
+    # This doesn't change within a single run, so cache it rather than re-reading the
+    # environment (and performing the `isatty` syscall) for every colorized string.
     return (getenv('CLICOLOR', '1') != '0' and stdout.isatty())\
         or getenv('CLICOLOR_FORCE', '0') != '0'
 
@@ -17,12 +21,25 @@ class AnsiColor(Enum):
     PURPLE = '[95m'
 
 
+# Precomputed escape sequences, so that colorize doesn't need to re-assemble them
+# for every string it wraps.
+_COLOR_PREFIX = {color: f'\x1b{color.value}' for color in AnsiColor}
+_RESET = f'\x1b{AnsiColor.RESET.value}'
+
+_COLOR_PREFIX_BYTES = {color: prefix.encode() for color, prefix in _COLOR_PREFIX.items()}
+_RESET_BYTES = _RESET.encode()
+
+
 def colorize(text: str, color: AnsiColor) -> str:
-    if not supports_ansi_colors():
+    if not text or not supports_ansi_colors():
+        return text
+
+    return _COLOR_PREFIX[color] + text + _RESET
+
+
+def colorize_bytes(text: bytes, color: AnsiColor) -> bytes:
+    """Same as colorize, for pre-encoded output streams (saves an encode pass)."""
+    if not text or not supports_ansi_colors():
         return text
 
-    return '\x1b{}{}\x1b{}'.format(
-        color.value,
-        text,
-        AnsiColor.RESET.value,
-    )
+    return _COLOR_PREFIX_BYTES[color] + text + _RESET_BYTES
@@ -46,6 +46,9 @@ setup(
         'gibberish': [
             'gibberish-detector',
         ],
+        're2': [
+            'google-re2',
+        ],
     },
     entry_points={
         'console_scripts': [
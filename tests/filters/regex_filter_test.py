@@ -89,6 +89,26 @@ def test_should_exclude_secret(parser):
     ]
 
 
+def test_should_exclude_line_with_inline_flag(parser):
+    parser.parse_args([
+        '--exclude-lines', '(?i)canarytoken',
+        '--exclude-lines', 'hunter2',
+    ])
+    assert filters.regex.should_exclude_line('password = "CANARYTOKEN"') is True
+    assert filters.regex.should_exclude_line('password = "t0psecret"') is False
+
+
+def test_should_exclude_secret_with_backreferences(parser):
+    # Each pattern's backreference must keep resolving to its own capture group.
+    parser.parse_args([
+        '--exclude-secrets', r'(a+)-\1',
+        '--exclude-secrets', r'(b+)-\1',
+    ])
+    assert filters.regex.should_exclude_secret('bb-bb') is True
+    assert filters.regex.should_exclude_secret('aa-aa') is True
+    assert filters.regex.should_exclude_secret('aa-bb') is False
+
+
 def test_cache_should_be_cleared_with_different_settings(parser):
     with default_settings():
         parser.parse_args([
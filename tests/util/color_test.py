@@ -1,15 +1,24 @@
 from sys import stdout
 
+import pytest
+
 from detect_secrets.util.color import AnsiColor
 from detect_secrets.util.color import colorize
+from detect_secrets.util.color import colorize_bytes
+from detect_secrets.util.color import supports_ansi_colors
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Since the result is cached, we need to clear it between tests that modify
+    # the environment.
+    supports_ansi_colors.cache_clear()
+    yield
+    supports_ansi_colors.cache_clear()
 
 
 def colorize_enabled(text: str, color: AnsiColor) -> str:
-    return '\x1b{}{}\x1b{}'.format(
-        color.value,
-        text,
-        AnsiColor.RESET.value,
-    )
+    return f'\x1b{color.value}{text}\x1b{AnsiColor.RESET.value}'
 
 
 def expect_enabled(text: str):
@@ -42,3 +51,18 @@ def test_colorize_disabled(monkeypatch):
     monkeypatch.setenv('CLICOLOR', '0')
 
     expect_disabled('abc')
+
+
+def test_colorize_empty_string(monkeypatch):
+    monkeypatch.setenv('CLICOLOR_FORCE', '1')
+
+    for color in AnsiColor:
+        assert colorize('', color) == ''
+
+
+def test_colorize_bytes(monkeypatch):
+    monkeypatch.setenv('CLICOLOR_FORCE', '1')
+
+    for color in AnsiColor:
+        assert colorize_bytes(b'abc', color) == colorize_enabled('abc', color).encode()
+        assert colorize_bytes(b'', color) == b''